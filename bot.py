@@ -17,13 +17,28 @@ IMPORTANT:
 - Run as a systemd service or via nohup/screen on a VPS to keep it running every day.
 """
 
-import os
-import time
-import json
-import math
-import requests
-from datetime import datetime, timedelta, time as dtime
-from apscheduler.schedulers.background import BackgroundScheduler
+import signal
+import asyncio
+import aiohttp
+import orjson
+import numpy as np
+from cachetools import LRUCache, TTLCache
+from dataclasses import dataclass
+from datetime import datetime, time as dtime
+from pytz import timezone
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op decorator so the scanners still run (interpreted) without numba."""
+        if args and callable(args[0]):
+            return args[0]
+        def wrap(func):
+            return func
+        return wrap
 
 # ------------------ CONFIG ------------------
 TELEGRAM_TOKEN = "8287859714:AAF1pSAlSXsa-NlWIwZ4xDcaYcs3KMueu0k"    # e.g. "123456:ABC-DEF..."
@@ -35,6 +50,7 @@ SYMBOL_XAU = "XAU/USD"   # TwelveData symbol for gold
 SYMBOL_BTC = "BTC/USD"
 
 # User preferences / session config (Pakistan time)
+PK_TZ = timezone("Asia/Karachi")
 NY_SESSION_START_PK = dtime(hour=17, minute=0)     # 17:00 Pakistan time (UTC+5)
 PRE_ALERT_MINUTES = 5     # minutes before session start
 POST_ALERT_MINUTES = 5    # minutes after session start
@@ -45,29 +61,78 @@ BTC_SL_USD = 350          # default 300-400 range; using 350 as mid
 RR = 4                    # 1:4 risk reward
 MIN_VOLUME_THRESHOLD = None   # placeholder for providers with volume info
 
+# Telegram endpoint and payload fields that never change between sends
+_TG_URL = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
+_TG_BASE = {
+    "chat_id": TELEGRAM_CHAT_ID,
+    "parse_mode": "HTML",
+    "disable_web_page_preview": True
+}
+
+# ------------------ HTTP SESSION ------------------
+# One pooled session for the whole process: both Telegram and TwelveData are hit
+# several times per alert, so keep-alive avoids paying a fresh TCP+TLS handshake
+# on every call. Created lazily because aiohttp sessions need a running loop.
+
+_SESSION = None
+
+async def get_session():
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = aiohttp.ClientSession(
+            # fail fast on connect problems instead of burning the whole budget on a stalled handshake
+            timeout=aiohttp.ClientTimeout(total=12, connect=3, sock_read=8),
+            # resolve each API host at most every 5 minutes; keep-alive covers the rest
+            connector=aiohttp.TCPConnector(limit=8, use_dns_cache=True, ttl_dns_cache=300)
+        )
+    return _SESSION
+
+async def _request_json(method: str, url: str, retries: int = 3, **kwargs):
+    """Issue a request, retrying transient 429/5xx and network errors with backoff."""
+    session = await get_session()
+    for attempt in range(retries + 1):
+        try:
+            async with session.request(method, url, **kwargs) as resp:
+                if resp.status in (429, 500, 502, 503, 504) and attempt < retries:
+                    raise aiohttp.ClientResponseError(
+                        resp.request_info, resp.history, status=resp.status)
+                body = await resp.read()
+                # explicit status check: one body read on the happy path, and error
+                # responses surface their payload instead of a bare status line
+                if resp.status >= 400:
+                    raise RuntimeError(f"HTTP {resp.status} from {url}: {body[:200]!r}")
+                # orjson parses the float-heavy TwelveData bodies several times faster than stdlib json
+                return orjson.loads(body)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt >= retries:
+                raise
+            await asyncio.sleep(0.3 * (2 ** attempt))
+
+# Short-lived cache so repeated fetches of the same (symbol, interval, outputsize)
+# within one alert cycle reuse the response instead of spending TwelveData quota.
+_SERIES_CACHE = TTLCache(maxsize=16, ttl=60)
+
 # ------------------ HELPERS ------------------
 
-def send_telegram_message(text: str):
+async def send_telegram_message(text: str):
     """Send a message via Telegram Bot API."""
-    url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
-    payload = {
-        "chat_id": TELEGRAM_CHAT_ID,
-        "text": text,
-        "parse_mode": "HTML",
-        "disable_web_page_preview": True
-    }
     try:
-        resp = requests.post(url, json=payload, timeout=10)
-        resp.raise_for_status()
-        return resp.json()
+        return await _request_json("POST", _TG_URL,
+                                   data=orjson.dumps({**_TG_BASE, "text": text}),
+                                   headers={"Content-Type": "application/json"})
     except Exception as e:
         print("Telegram send error:", e)
         return None
 
-def twelvedata_get_series(symbol: str, interval: str = "15min", outputsize: int = 100):
+async def twelvedata_get_series(symbol: str, interval: str = "15min", outputsize: int = 100):
     """Fetch time series from TwelveData. Returns list of candles newest-last."""
     if not TD_API_KEY:
         raise RuntimeError("TwelveData API key not set. Set TD_API_KEY in the config.")
+    key = (symbol, interval, outputsize)
+    try:
+        return _SERIES_CACHE[key]
+    except KeyError:
+        pass
     base = "https://api.twelvedata.com/time_series"
     params = {
         "symbol": symbol,
@@ -76,30 +141,89 @@ def twelvedata_get_series(symbol: str, interval: str = "15min", outputsize: int
         "format": "JSON",
         "apikey": TD_API_KEY
     }
-    r = requests.get(base, params=params, timeout=12)
-    r.raise_for_status()
-    data = r.json()
+    data = await _request_json("GET", base, params=params)
     if "values" not in data:
         raise RuntimeError(f"TwelveData error or invalid response: {data}")
     # data["values"] is newest-first; convert to oldest-first list of dicts
-    return list(reversed(data["values"]))
+    result = list(reversed(data["values"]))
+    _SERIES_CACHE[key] = result
+    return result
 
-def parse_candles(raw_candles):
-    """Convert TwelveData candle dicts to list of dicts with numeric fields and datetime objects."""
-    out = []
-    for c in raw_candles:
-        out.append({
-            "datetime": datetime.fromisoformat(c["datetime"]),
-            "open": float(c["open"]),
-            "high": float(c["high"]),
-            "low": float(c["low"]),
-            "close": float(c["close"]),
-            "volume": float(c.get("volume") or 0)
-        })
+async def twelvedata_get_series_multi(symbols, interval: str = "15min", outputsize: int = 100):
+    """Fetch several symbols' series in one request. Returns {symbol: candles newest-last}."""
+    if not TD_API_KEY:
+        raise RuntimeError("TwelveData API key not set. Set TD_API_KEY in the config.")
+    key = (tuple(symbols), interval, outputsize)
+    try:
+        return _SERIES_CACHE[key]
+    except KeyError:
+        pass
+    base = "https://api.twelvedata.com/time_series"
+    params = {
+        "symbol": ",".join(symbols),
+        "interval": interval,
+        "outputsize": outputsize,
+        "format": "JSON",
+        "apikey": TD_API_KEY
+    }
+    data = await _request_json("GET", base, params=params)
+    # with a single symbol TwelveData returns a flat object; with several, one object per symbol
+    if "values" in data:
+        return {symbols[0]: list(reversed(data["values"]))}
+    out = {}
+    for sym in symbols:
+        entry = data.get(sym)
+        if not entry or "values" not in entry:
+            raise RuntimeError(f"TwelveData error or invalid response for {sym}: {entry or data}")
+        out[sym] = list(reversed(entry["values"]))
+    _SERIES_CACHE[key] = out
     return out
 
+@dataclass(slots=True)
+class Candles:
+    """Column-oriented (SoA) candle batch: one array per field, oldest-first."""
+    dt: np.ndarray
+    o: np.ndarray
+    h: np.ndarray
+    l: np.ndarray
+    c: np.ndarray
+    v: np.ndarray
+
+def parse_candles(raw_candles):
+    """Convert TwelveData candle dicts to column (SoA) arrays of numeric fields."""
+    n = len(raw_candles)
+    return Candles(
+        # numpy parses the ISO strings in C, one vectorized pass instead of n fromisoformat calls
+        dt=np.array([c["datetime"] for c in raw_candles], dtype="datetime64[s]"),
+        o=np.fromiter((float(c["open"]) for c in raw_candles), dtype=np.float64, count=n),
+        h=np.fromiter((float(c["high"]) for c in raw_candles), dtype=np.float64, count=n),
+        l=np.fromiter((float(c["low"]) for c in raw_candles), dtype=np.float64, count=n),
+        c=np.fromiter((float(c["close"]) for c in raw_candles), dtype=np.float64, count=n),
+        v=np.fromiter((float(c.get("volume") or 0) for c in raw_candles), dtype=np.float64, count=n)
+    )
+
 # ------------------ STRATEGY SIGNALS ------------------
 
+@njit(cache=True)
+def _sweep_scan_loop(o, h, l, c, start):
+    """Find a local-min low with a long lower wick followed by a green candle after `start`.
+
+    Module-level, array-only and branchless: the criteria are evaluated as boolean
+    arrays over the whole window so numba (or plain numpy) vectorizes the comparisons.
+    Returns (sweep_idx, confirm_idx), or (-1, -1) when nothing matches.
+    """
+    o, h, l, c = o[start:], h[start:], l[start:], c[start:]
+    # candidate sweep candles are the interior of the window (never first or last)
+    is_local_min = (l[1:-1] < l[:-2]) & (l[1:-1] < l[2:])
+    range_ = np.maximum(h[1:-1] - l[1:-1], 1e-6)
+    lower_wick = np.where(o[1:-1] > c[1:-1], o[1:-1] - l[1:-1], c[1:-1] - l[1:-1])
+    green_next = c[2:] > o[2:]
+    match = is_local_min & (lower_wick / range_ > 0.4) & green_next
+    if not match.any():
+        return -1, -1
+    i = start + 1 + np.argmax(match)  # argmax of bools = first match, same as the old loop
+    return i, i + 1
+
 def detect_sweep_and_green(candles_15m, lookback=6):
     """
     Detect simple 'sweep + green close' pattern on 15m timeframe.
@@ -109,48 +233,50 @@ def detect_sweep_and_green(candles_15m, lookback=6):
       - The candle after that (or the latest candle) must close green (close > open) and preferably engulf part of the sweep body.
     Returns dict with boolean and context fields.
     """
-    if len(candles_15m) < lookback+2:
+    n = len(candles_15m.c)
+    if n < lookback+2:
         return {"signal": False, "reason": "not_enough_data"}
-    # use the last lookback+1 candles
-    window = candles_15m[-(lookback+1):]
-    lows = [c["low"] for c in window]
-    # find potential sweep index (not the last candle)
-    for i in range(1, len(window)-1):
-        if window[i]["low"] < window[i-1]["low"] and window[i]["low"] < window[i+1]["low"]:
-            # check wick: lower wick length relative to candle range
-            body = abs(window[i]["open"] - window[i]["close"])
-            lower_wick = window[i]["open"] - window[i]["low"] if window[i]["open"] > window[i]["close"] else window[i]["close"] - window[i]["low"]
-            range_ = window[i]["high"] - window[i]["low"] if window[i]["high"] - window[i]["low"] > 0 else 1e-6
-            if lower_wick / range_ > 0.4:  # wick is significant
-                # check the next/latest candle is green
-                next_candle = window[i+1]
-                if next_candle["close"] > next_candle["open"]:
-                    return {
-                        "signal": True,
-                        "sweep_candle": window[i],
-                        "confirm_candle": next_candle,
-                        "sweep_index_from_end": len(window)-(i+1)  # position relative to end
-                    }
-    return {"signal": False, "reason": "no_sweep_found"}
-
-def detect_bullish_engulfing(candle_prev, candle_latest):
-    """Simple bullish engulfing detector between two candles (dicts with open/high/low/close)."""
-    return candle_prev["close"] < candle_prev["open"] and candle_latest["close"] > candle_latest["open"] and candle_latest["close"] > candle_prev["open"] and candle_latest["open"] < candle_prev["close"]
-
-def compute_liquidity_zones(candles, lookback_hours=24):
-    """Return simple liquidity zones as min lows and max highs over recent period (e.g., last N candles)."""
-    # use last N candles (~lookback_hours worth depending on timeframe)
-    lows = [c["low"] for c in candles]
-    highs = [c["high"] for c in candles]
+    # scan only the last lookback+1 candles (never the last one as sweep)
+    start = n - (lookback + 1)
+    sweep_i, confirm_i = _sweep_scan_loop(candles_15m.o, candles_15m.h, candles_15m.l, candles_15m.c, start)
+    if sweep_i < 0:
+        return {"signal": False, "reason": "no_sweep_found"}
     return {
-        "recent_low": min(lows),
-        "recent_high": max(highs),
-        "last_close": candles[-1]["close"]
+        "signal": True,
+        "sweep_low": float(candles_15m.l[sweep_i]),
+        "confirm_open": float(candles_15m.o[confirm_i]),
+        "confirm_close": float(candles_15m.c[confirm_i]),
+        "sweep_index_from_end": n - (sweep_i + 1)  # position relative to end
+    }
+
+def detect_bullish_engulfing(candles, i=-1):
+    """Simple bullish engulfing detector between candle i-1 and candle i of a Candles batch."""
+    o, c = candles.o, candles.c
+    return c[i-1] < o[i-1] and c[i] > o[i] and c[i] > o[i-1] and o[i] < c[i-1]
+
+# ndarrays are unhashable, so the zones are memoized manually by the newest bar
+_LIQUIDITY_CACHE = LRUCache(maxsize=8)
+
+def compute_liquidity_zones(candles, window=96):
+    """Return simple liquidity zones as min lows and max highs over the last `window` candles."""
+    # newest timestamp + close identifies the batch (the close disambiguates
+    # symbols whose latest bars share a timestamp)
+    key = (candles.dt[-1].item(), float(candles.c[-1]), window)
+    try:
+        return _LIQUIDITY_CACHE[key]
+    except KeyError:
+        pass
+    zones = {
+        "recent_low": float(candles.l[-window:].min()),
+        "recent_high": float(candles.h[-window:].max()),
+        "last_close": float(candles.c[-1])
     }
+    _LIQUIDITY_CACHE[key] = zones
+    return zones
 
 # ------------------ TRADE PLAN BUILDER ------------------
 
-def build_xau_trade_plan(latest_15m, latest_5m, detection):
+def build_xau_trade_plan(candles_15m, candles_5m, detection):
     """
     Build XAU trade plan according to user's rules:
       - If sweep + green detected -> LONG
@@ -158,14 +284,12 @@ def build_xau_trade_plan(latest_15m, latest_5m, detection):
       - SL: 20 pips below sweep low
       - TP: RR 1:4 targets
     """
-    sweep = detection["sweep_candle"]
-    confirm = detection["confirm_candle"]
-    sweep_low = sweep["low"]
+    sweep_low = detection["sweep_low"]
     # pip conversion: assume 1 pip = 0.01 for XAU typical brokers
     pip_value = 0.01
     sl_price = sweep_low - (XAU_SL_PIPS * pip_value)
     # entry: a small buffer above confirm candle open or midpoint between sweep low and confirm close
-    entry = max(confirm["open"] + 0.02, (confirm["close"] + sweep_low) / 2)
+    entry = max(detection["confirm_open"] + 0.02, (detection["confirm_close"] + sweep_low) / 2)
     rr_distance = entry - sl_price
     tp = entry + rr_distance * RR
     tp1 = entry + rr_distance * 1.0  # same as RR*? keep conservative
@@ -179,15 +303,13 @@ def build_xau_trade_plan(latest_15m, latest_5m, detection):
         "logic": "Sweep detected + green confirm on 15m"
     }
 
-def build_btc_trade_plan(latest_15m, latest_5m, detection):
+def build_btc_trade_plan(candles_15m, candles_5m, detection):
     """
     Similar builder for BTC. Use USD pip notion (1 pip = $1 here for simplicity).
     """
-    sweep = detection["sweep_candle"]
-    confirm = detection["confirm_candle"]
-    sweep_low = sweep["low"]
+    sweep_low = detection["sweep_low"]
     sl_price = sweep_low - BTC_SL_USD
-    entry = max(confirm["open"] + 1.0, (confirm["close"] + sweep_low) / 2)
+    entry = max(detection["confirm_open"] + 1.0, (detection["confirm_close"] + sweep_low) / 2)
     rr_distance = entry - sl_price
     tp = entry + rr_distance * RR
     return {
@@ -202,95 +324,130 @@ def build_btc_trade_plan(latest_15m, latest_5m, detection):
 
 # ------------------ MAIN ALERT LOGIC ------------------
 
-def get_and_analyze(symbol, interval_15m="15min", interval_5m="5min"):
+async def get_and_analyze(symbol, interval_15m="15min", interval_5m="5min"):
     """Fetch candles and run detection, returning plan or None."""
     try:
-        raw_15m = twelvedata_get_series(symbol, interval=interval_15m, outputsize=200)
-        raw_5m = twelvedata_get_series(symbol, interval=interval_5m, outputsize=200)
+        # 96 x 15m covers the 24h liquidity window; only the latest 5m candle is consumed
+        raw_15m, raw_5m = await asyncio.gather(
+            twelvedata_get_series(symbol, interval=interval_15m, outputsize=96),
+            twelvedata_get_series(symbol, interval=interval_5m, outputsize=2))
     except Exception as e:
         return {"error": f"data_fetch_error: {e}"}
+    return analyze_series(symbol, raw_15m, raw_5m)
 
+def analyze_series(symbol, raw_15m, raw_5m):
+    """Run detection on already-fetched candle series, returning the analysis dict."""
     candles_15m = parse_candles(raw_15m)
     candles_5m = parse_candles(raw_5m)
     detection = detect_sweep_and_green(candles_15m, lookback=6)
-    liquidity = compute_liquidity_zones(candles_15m[-96:])  # last 24 hours approx (96 * 15m = 24h)
+    liquidity = compute_liquidity_zones(candles_15m, window=96)  # last 24 hours approx (96 * 15m = 24h)
     result = {
         "symbol": symbol,
         "detection": detection,
         "liquidity": liquidity,
-        "latest_15m": candles_15m[-1],
-        "latest_5m": candles_5m[-1]
+        "last_close_15m": float(candles_15m.c[-1]),
+        "last_close_5m": float(candles_5m.c[-1])
     }
     if detection.get("signal"):
         if "XAU" in symbol:
-            result["plan"] = build_xau_trade_plan(candles_15m[-1], candles_5m[-1], detection)
+            result["plan"] = build_xau_trade_plan(candles_15m, candles_5m, detection)
         else:
-            result["plan"] = build_btc_trade_plan(candles_15m[-1], candles_5m[-1], detection)
+            result["plan"] = build_btc_trade_plan(candles_15m, candles_5m, detection)
     return result
 
+async def scan_symbols():
+    """Batch-fetch both symbols per interval (two concurrent requests) and analyze them."""
+    # 96 x 15m covers the 24h liquidity window; only the latest 5m candle is consumed
+    raw_15m, raw_5m = await asyncio.gather(
+        twelvedata_get_series_multi([SYMBOL_XAU, SYMBOL_BTC], interval="15min", outputsize=96),
+        twelvedata_get_series_multi([SYMBOL_XAU, SYMBOL_BTC], interval="5min", outputsize=2))
+    return tuple(analyze_series(sym, raw_15m[sym], raw_5m[sym]) for sym in (SYMBOL_XAU, SYMBOL_BTC))
+
 def format_plan_message(analysis):
     """Format the plan into an HTML message for Telegram."""
     if "error" in analysis:
         return f"⚠ Error fetching data: {analysis['error']}"
+    liq = analysis["liquidity"]
     if not analysis.get("plan"):
-        return f"ℹ <b>{analysis['symbol']}</b>\nNo Sweep+Green confirmation found on 15m.\nLiquidity snapshot: Low {analysis['liquidity']['recent_low']}, High {analysis['liquidity']['recent_high']}\nLast close: {analysis['liquidity']['last_close']}"
+        return (
+            f"ℹ <b>{analysis['symbol']}</b>\n"
+            "No Sweep+Green confirmation found on 15m.\n"
+            f"Liquidity snapshot: Low {liq['recent_low']}, High {liq['recent_high']}\n"
+            f"Last close: {liq['last_close']}"
+        )
     p = analysis["plan"]
-    msg = f"<b>Pro SmartMoney Setup — {analysis['symbol']}</b>\n"
-    msg += f"Logic: {p['logic']}\n"
-    msg += f"Side: <b>{p['side']}</b>\n"
-    msg += f"Entry: <code>{p['entry']}</code>\nSL: <code>{p['sl']}</code>\nTP: <code>{p['tp']}</code>\nTP1: <code>{p.get('tp1')}</code>\nConfidence: {int(p['confidence']*100)}%\n\n"
-    msg += f"Liquidity (24h): Low {analysis['liquidity']['recent_low']}, High {analysis['liquidity']['recent_high']}\n"
-    msg += f"Latest 15m close: {analysis['latest_15m']['close']}\n"
-    msg += "Trade Management:\n- TP1 hit -> move SL to break-even\n- TP2 hit -> scale out 50%\n- TP3 -> leave runner or full close\n"
-    msg += "\n---\nPowered by Liquidity Matrix Bot"
-    return msg
+    # adjacent literals are joined at compile time, so this builds one str in one pass
+    return (
+        f"<b>Pro SmartMoney Setup — {analysis['symbol']}</b>\n"
+        f"Logic: {p['logic']}\n"
+        f"Side: <b>{p['side']}</b>\n"
+        f"Entry: <code>{p['entry']}</code>\n"
+        f"SL: <code>{p['sl']}</code>\n"
+        f"TP: <code>{p['tp']}</code>\n"
+        f"TP1: <code>{p.get('tp1')}</code>\n"
+        f"Confidence: {int(p['confidence']*100)}%\n\n"
+        f"Liquidity (24h): Low {liq['recent_low']}, High {liq['recent_high']}\n"
+        f"Latest 15m close: {analysis['last_close_15m']}\n"
+        "Trade Management:\n"
+        "- TP1 hit -> move SL to break-even\n"
+        "- TP2 hit -> scale out 50%\n"
+        "- TP3 -> leave runner or full close\n"
+        "\n---\nPowered by Liquidity Matrix Bot"
+    )
 
 # ------------------ SCHEDULER TASKS ------------------
 
-def job_pre_alert():
-    """Send pre-session liquidity snapshot ~5 minutes before NY session start."""
-    now = datetime.utcnow() + timedelta(hours=5)  # convert to Pakistan time naive (UTC+5)
-    text = f"🕒 <b>Pre-NY Alert</b>\nTime (PK): {now.strftime('%Y-%m-%d %H:%M')}\nScanning liquidity for XAU & BTC..."
-    send_telegram_message(text)
-    # quick snapshot: compute liquidity zones but do not require sweep confirmation
+async def _send_scan_report(header: str, error_label: str):
+    """Scan both symbols and deliver header + both reports as a single Telegram message."""
     try:
-        x = get_and_analyze(SYMBOL_XAU, interval_15m="15min", interval_5m="5min")
-        b = get_and_analyze(SYMBOL_BTC, interval_15m="15min", interval_5m="5min")
-        send_telegram_message(format_plan_message(x))
-        send_telegram_message(format_plan_message(b))
+        x, b = await scan_symbols()
+        msg = f"{header}\n\n{format_plan_message(x)}\n\n{format_plan_message(b)}"
+        if len(msg) < 4096:  # Telegram's per-message size cap
+            await send_telegram_message(msg)
+        else:
+            await send_telegram_message(header)
+            await asyncio.gather(
+                send_telegram_message(format_plan_message(x)),
+                send_telegram_message(format_plan_message(b)))
+    except (asyncio.TimeoutError, aiohttp.ClientError):
+        # a slow/unreachable upstream gets one short notice, not a cascade of errors
+        await send_telegram_message(f"{error_label}: data stall — upstream fetch timed out, skipping this scan")
     except Exception as e:
-        send_telegram_message(f"Pre-alert error: {e}")
+        await send_telegram_message(f"{error_label}: {e}")
+
+async def job_pre_alert():
+    """Send pre-session liquidity snapshot ~5 minutes before NY session start."""
+    now = datetime.now(PK_TZ)
+    header = f"🕒 <b>Pre-NY Alert</b>\nTime (PK): {now.strftime('%Y-%m-%d %H:%M')}\nLiquidity scan for XAU & BTC:"
+    await _send_scan_report(header, "Pre-alert error")
 
-def job_post_open():
+async def job_post_open():
     """Post-session alert ~5 minutes after session open — look for sweep+confirm and send plan if found."""
-    now = datetime.utcnow() + timedelta(hours=5)
-    text = f"🕒 <b>NY Post-Open Alert</b>\nTime (PK): {now.strftime('%Y-%m-%d %H:%M')}\nScanning for sweep+confirm on 15m..."
-    send_telegram_message(text)
-    try:
-        x = get_and_analyze(SYMBOL_XAU, interval_15m="15min", interval_5m="5min")
-        b = get_and_analyze(SYMBOL_BTC, interval_15m="15min", interval_5m="5min")
-        send_telegram_message(format_plan_message(x))
-        send_telegram_message(format_plan_message(b))
-    except Exception as e:
-        send_telegram_message(f"Post-open error: {e}")
-
-def start_scheduler():
-    sched = BackgroundScheduler(timezone="UTC")
-    # Compute UTC times for our PK times
-    # PK is UTC+5. To schedule at PK 16:55 and 17:05 convert to UTC:
-    pre_pk = datetime.combine(datetime.utcnow().date(), (datetime.min + timedelta(hours=16, minutes=55)).time())
-    post_pk = datetime.combine(datetime.utcnow().date(), (datetime.min + timedelta(hours=17, minutes=5)).time())
-    # Instead, add daily jobs at fixed hour/min in PK by converting to UTC:
-    sched.add_job(job_pre_alert, 'cron', hour=(16-5), minute=55)   # PK 16:55 -> UTC 11:55
-    sched.add_job(job_post_open, 'cron', hour=(17-5), minute=5)    # PK 17:05 -> UTC 12:05
+    now = datetime.now(PK_TZ)
+    header = f"🕒 <b>NY Post-Open Alert</b>\nTime (PK): {now.strftime('%Y-%m-%d %H:%M')}\nSweep+confirm scan on 15m:"
+    await _send_scan_report(header, "Post-open error")
+
+async def start_scheduler():
+    sched = AsyncIOScheduler(timezone=PK_TZ)
+    # tz-aware triggers: no manual UTC offset arithmetic, immune to host-TZ/DST surprises
+    # max_instances/coalesce keep a stalled fetch from piling up overlapping runs;
+    # the 120s grace still fires a late alert rather than silently dropping the day
+    sched.add_job(job_pre_alert, CronTrigger(hour=16, minute=55, timezone=PK_TZ),
+                  misfire_grace_time=120, coalesce=True, max_instances=1)
+    sched.add_job(job_post_open, CronTrigger(hour=17, minute=5, timezone=PK_TZ),
+                  misfire_grace_time=120, coalesce=True, max_instances=1)
     sched.start()
     print("Scheduler started. Pre-alert at PK 16:55, Post-open at PK 17:05")
-    try:
-        # keep the process alive
-        while True:
-            time.sleep(1)
-    except (KeyboardInterrupt, SystemExit):
-        sched.shutdown()
+    # park until SIGINT/SIGTERM instead of polling at 1 Hz; the scheduler
+    # wakes the loop on its own when a job is due
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    await stop.wait()
+    sched.shutdown(wait=False)
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
 
 # ------------------ CLI / RUN ------------------
 
@@ -301,4 +458,4 @@ if __name__ == "__main__":
         print("If you want to test without scheduling, call get_and_analyze() manually.")
     else:
         print("Starting Liquidity Matrix Bot...")
-        start_scheduler()
+        asyncio.run(start_scheduler())